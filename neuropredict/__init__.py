@@ -37,7 +37,9 @@ from sys import version_info
 if version_info.major > 2:
     # importing config_neuropredict first (before run_workflow) to avoid a circular situation (when running run_workflow directly)
     from neuropredict import config_neuropredict
-    from neuropredict import rhst, visualize, freesurfer, compare, run_workflow
+    # rhst, visualize, freesurfer and compare are not imported here, to keep the
+    # cmd line startup light; they remain importable e.g. from neuropredict import rhst
+    from neuropredict import run_workflow
     from neuropredict.run_workflow import cli
     # ^^ importing run_workflow last to  avoid a circular situation (when running run_workflow directly)
 else:
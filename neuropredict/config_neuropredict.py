@@ -134,6 +134,7 @@ file_name_best_param_values = 'best_parameter_values.pkl'
 max_len_identifiers = 75
 
 output_dir_default = 'neuropredict_results'
+options_cache_dir = '.opts_cache'
 temp_results_dir = 'temp_scratch_neuropredict'
 temp_prefix_rhst  = 'trial'
 EXPORT_DIR_NAME = 'exported_results'
@@ -12,19 +12,16 @@ import sys
 import textwrap
 import traceback
 import warnings
-import matplotlib.pyplot as plt
 from sys import version_info
 from os.path import join as pjoin, exists as pexists, abspath, realpath, basename
 import numpy as np
-from pyradigm.utils import load_dataset
 
 if version_info.major > 2:
     # the order of import is very important to avoid circular imports
+    # rhst, visualize, freesurfer and pyplot are imported only inside the
+    # functions using them, to keep --help and --print_options fast
     from neuropredict import __version__
     from neuropredict import config_neuropredict as cfg
-    from neuropredict import rhst, visualize
-    from neuropredict.freesurfer import (aseg_stats_subcortical,
-                                         aseg_stats_whole_brain)
     from neuropredict.io import (get_metadata, get_features,
                                  get_metadata_in_pyradigm,
                                  get_data_matrix, get_dir_of_dirs, get_pyradigm,
@@ -33,6 +30,8 @@ if version_info.major > 2:
     from neuropredict.utils import (check_paths, uniq_combined_name,
                                     check_num_procs,
                                     sub_group_identifier, save_options, load_options,
+                                    options_cache_key, load_cached_options,
+                                    cache_options,
                                     validate_feature_selection_size,
                                     make_dataset_filename, not_unspecified,
                                     check_classifier)
@@ -262,6 +261,15 @@ def get_parser():
     
     """)
 
+    help_text_no_cache = textwrap.dedent("""
+    Flag to disable the reuse of options validated in a previous invocation 
+    with identical arguments and unchanged input files. 
+    
+    By default, validated options are cached in the output folder, 
+    and reused to skip parsing of the metadata on repeat invocations.
+    
+    """)
+
     parser.add_argument("-m", "--meta_file", action="store", dest="meta_file",
                         default=None, required=False, help=help_text_metadata_file)
 
@@ -381,6 +389,9 @@ def get_parser():
                            dest="print_opt_dir",
                            default=False, help=help_text_print_options)
 
+    comp_args.add_argument("--no_cache", action="store_true", dest="no_cache",
+                           default=False, help=help_text_no_cache)
+
     comp_args.add_argument('-v', '--version', action='version',
                            version='%(prog)s {version}'.format(version=__version__))
 
@@ -539,29 +550,45 @@ def parse_args():
 
             sys.exit(0)
 
-    user_feature_paths, user_feature_type, fs_subject_dir, meta_data_path, \
-        meta_data_format = organize_inputs(user_args)
-
-    if not meta_data_path:
-        if user_args.meta_file is not None:
-            meta_file = abspath(user_args.meta_file)
-            if not pexists(meta_file):
-                raise IOError("Meta data file doesn't exist.")
-        else:
-            raise ValueError('Metadata file must be provided '
-                             'when not using pyradigm/ARFF inputs.')
-
-        sample_ids, classes = get_metadata(meta_file)
-    else:
-        print('Using meta data from:\n{}'.format(meta_data_path))
-        sample_ids, classes = get_metadata_in_pyradigm(meta_data_path,
-                                                       meta_data_format)
-
     if user_args.out_dir is not None:
         out_dir = realpath(user_args.out_dir)
     else:
         out_dir = pjoin(realpath(os.getcwd()), cfg.output_dir_default)
 
+    # reusing the inputs and metadata parsed in a previous identical invocation
+    use_cache = not user_args.no_cache
+    cached_inputs = None
+    if use_cache:
+        cache_key = options_cache_key(user_args, _input_paths(user_args))
+        cached_inputs = load_cached_options(out_dir, cache_key)
+
+    if cached_inputs is not None:
+        print('Reusing the meta data parsed previously, cached in:\n{}'
+              ''.format(pjoin(out_dir, cfg.options_cache_dir)))
+        user_feature_paths = cached_inputs['user_feature_paths']
+        user_feature_type = cached_inputs['user_feature_type']
+        fs_subject_dir = cached_inputs['fs_subject_dir']
+        sample_ids = cached_inputs['sample_ids']
+        classes = cached_inputs['classes']
+    else:
+        user_feature_paths, user_feature_type, fs_subject_dir, meta_data_path, \
+            meta_data_format = organize_inputs(user_args)
+
+        if not meta_data_path:
+            if user_args.meta_file is not None:
+                meta_file = abspath(user_args.meta_file)
+                if not pexists(meta_file):
+                    raise IOError("Meta data file doesn't exist.")
+            else:
+                raise ValueError('Metadata file must be provided '
+                                 'when not using pyradigm/ARFF inputs.')
+
+            sample_ids, classes = get_metadata(meta_file)
+        else:
+            print('Using meta data from:\n{}'.format(meta_data_path))
+            sample_ids, classes = get_metadata_in_pyradigm(meta_data_path,
+                                                           meta_data_format)
+
     try:
         os.makedirs(out_dir, exist_ok=True)
     except:
@@ -601,6 +628,14 @@ def parse_args():
                        grid_search_level, classifier, feat_select_method]
     options_path = save_options(options_to_save, out_dir)
 
+    if use_cache and cached_inputs is None:
+        parsed_inputs = {'user_feature_paths': user_feature_paths,
+                         'user_feature_type' : user_feature_type,
+                         'fs_subject_dir'    : fs_subject_dir,
+                         'sample_ids'        : sample_ids,
+                         'classes'           : classes}
+        cache_options(parsed_inputs, out_dir, cache_key)
+
     return sample_ids, classes, out_dir, options_path, \
            user_feature_paths, user_feature_type, fs_subject_dir, \
            train_perc, num_rep_cv, \
@@ -609,6 +644,22 @@ def parse_args():
            grid_search_level, classifier, feat_select_method
 
 
+def _input_paths(user_args):
+    """Returns the list of input paths whose changes must invalidate the cache."""
+
+    input_paths = list()
+    for attr in ('meta_file', 'fs_subject_dir'):
+        if not_unspecified(getattr(user_args, attr)):
+            input_paths.append(realpath(getattr(user_args, attr)))
+
+    for attr in ('user_feature_paths', 'data_matrix_paths',
+                 'pyradigm_paths', 'arff_paths'):
+        if not_unspecified(getattr(user_args, attr)):
+            input_paths.extend(realpath(path) for path in getattr(user_args, attr))
+
+    return input_paths
+
+
 def make_visualizations(results_file_path, out_dir, options_path=None):
     """
     Produces the performance visualizations/comparison plots from the
@@ -624,6 +675,10 @@ def make_visualizations(results_file_path, out_dir, options_path=None):
 
     """
 
+    # deferred to avoid loading the plotting stack on paths not needing it
+    import matplotlib.pyplot as plt
+    from neuropredict import rhst, visualize
+
     results_dict = rhst.load_results_dict(results_file_path)
 
     # using shorter names for readability
@@ -819,6 +874,7 @@ def import_datasets(method_list, out_dir, subjects, classes,
     def clean_str(string): return ' '.join(string.strip().split(' _-:\n\r\t'))
 
     from neuropredict.io import process_pyradigm, process_arff
+    from pyradigm.utils import load_dataset
 
     method_names = list()
     outpath_list = list()
@@ -959,6 +1015,9 @@ def make_method_list(fs_subject_dir, user_feature_paths, user_feature_type='dir_
 
     """
 
+    from neuropredict.freesurfer import (aseg_stats_subcortical,
+                                         aseg_stats_whole_brain)
+
     freesurfer_readers = [aseg_stats_subcortical, aseg_stats_whole_brain]
     userdefined_readers = {'dir_of_dirs': get_dir_of_dirs,
                            'data_matrix': get_data_matrix,
@@ -1002,6 +1061,8 @@ def prepare_and_run(subjects, classes, out_dir, options_path,
                     grid_search_level, classifier, feat_select_method):
     "Organizes the inputs and prepares them for CV"
 
+    from neuropredict import rhst
+
     feature_dir, method_list = make_method_list(fs_subject_dir, user_feature_paths,
                                                 user_feature_type)
 
@@ -20,38 +20,48 @@ def test_balanced_accuracy():
     """Tests ensure the accuracy of accuracy calculations!"""
 
     num_trials = 10
+    rng = np.random.default_rng()
 
-    for num_classes in np.random.randint(2, 100, num_trials):
-        cm_100 = np.zeros((num_classes, num_classes), int)
+    # grouping trials by number of classes to generate the data in batches
+    sizes, counts = np.unique(rng.integers(2, 100, num_trials), return_counts=True)
+    for num_classes, batch_size in zip(sizes, counts):
+        diag = np.arange(num_classes)
+        shape = (batch_size, num_classes, num_classes)
+
+        cms_100 = np.zeros(shape, int)
         # no errors! sizes are imbalanced
-        np.fill_diagonal(cm_100, np.random.randint(10, 100, num_classes))
-        if not np.isclose(balanced_accuracy(cm_100), 1.0):
-            raise ArithmeticError('accuracy calculations on perfect classifier '
-                                  'does not return 100% accuracy!!')
+        cms_100[:, diag, diag] = rng.integers(10, 100, (batch_size, num_classes))
 
-        cm_100perc_wrong = np.random.randint(10, 100, (num_classes, num_classes))
+        cms_100perc_wrong = rng.integers(10, 100, shape)
         # ALL errors! sizes are imbalanced
-        np.fill_diagonal(cm_100perc_wrong, 0.0)
-        if not np.isclose(balanced_accuracy(cm_100perc_wrong), 0.0):
-            raise ArithmeticError('accuracy calculations on 100% wrong classifier '
-                                  'does not return 0% accuracy!!')
-
-        cm = np.random.randint(10, 100, (num_classes, num_classes)).astype('float64')
-        np.fill_diagonal(cm, 0)
-        class_sizes_without_diag_elemeent = cm.sum(axis=1)
-        chosen_accuracy = np.round(np.random.rand(num_classes), decimals=3)
+        cms_100perc_wrong[:, diag, diag] = 0
+
+        cms = rng.integers(10, 100, shape).astype('float64')
+        cms[:, diag, diag] = 0
+        class_sizes_without_diag_elemeent = cms.sum(axis=2)
+        chosen_accuracy = np.round(rng.random((batch_size, num_classes)), decimals=3)
         factor = chosen_accuracy / (1.0 - chosen_accuracy)
         # filling the diag in order to reach certain level of chosen accuracy
-        diag_values = np.around(class_sizes_without_diag_elemeent * factor).astype('float64')
-        np.fill_diagonal(cm, diag_values)
-        computed_acc = balanced_accuracy(cm)
-        expected_acc = np.mean(chosen_accuracy)
-        if not np.isclose(computed_acc, expected_acc, atol=1e-4):
-            raise ArithmeticError('accuracy calculations do not match the expected!!\n'
-                                  ' Expected : {:.8f}\n'
-                                  ' Estimated: {:.8f}\n'
-                                  ' Differ by: {:.8f}\n'.format(expected_acc, computed_acc,
-                                                                expected_acc - computed_acc))
+        cms[:, diag, diag] = np.around(class_sizes_without_diag_elemeent * factor)
+        expected_accs = chosen_accuracy.mean(axis=1)
+
+        for cm_100, cm_100perc_wrong, cm, expected_acc in zip(
+                cms_100, cms_100perc_wrong, cms, expected_accs):
+            if not np.isclose(balanced_accuracy(cm_100), 1.0):
+                raise ArithmeticError('accuracy calculations on perfect classifier '
+                                      'does not return 100% accuracy!!')
+
+            if not np.isclose(balanced_accuracy(cm_100perc_wrong), 0.0):
+                raise ArithmeticError('accuracy calculations on 100% wrong classifier '
+                                      'does not return 0% accuracy!!')
+
+            computed_acc = balanced_accuracy(cm)
+            if not np.isclose(computed_acc, expected_acc, atol=1e-4):
+                raise ArithmeticError('accuracy calculations do not match the expected!!\n'
+                                      ' Expected : {:.8f}\n'
+                                      ' Estimated: {:.8f}\n'
+                                      ' Differ by: {:.8f}\n'.format(expected_acc, computed_acc,
+                                                                    expected_acc - computed_acc))
 
 
 test_balanced_accuracy()
@@ -1,6 +1,8 @@
 
 import os
+import pickle
 import shlex
+import shutil
 import sys
 from os.path import abspath, dirname, exists as pexists, join as pjoin, realpath
 from sys import version_info
@@ -17,8 +19,8 @@ if __name__ == '__main__' and __package__ is None:
     sys.path.append(parent_dir)
 
 if version_info.major > 2:
-    from neuropredict import rhst, cli, config_neuropredict as cfg
-    from neuropredict.utils import chance_accuracy
+    from neuropredict import rhst, cli, run_workflow, config_neuropredict as cfg
+    from neuropredict.utils import chance_accuracy, load_options
 else:
     raise NotImplementedError('neuropredict supports only Python 3+.')
 
@@ -327,6 +329,143 @@ def test_print_options():
         cli()
 
 
+def _parse_args_counting_metadata(monkeypatch, cli_str):
+    """Runs parse_args on the given cmd line, counting the metadata reads."""
+
+    num_reads = list()
+    orig_get_metadata = run_workflow.get_metadata_in_pyradigm
+
+    def counting_get_metadata(*args, **kwargs):
+        num_reads.append(1)
+        return orig_get_metadata(*args, **kwargs)
+
+    monkeypatch.setattr(run_workflow, 'get_metadata_in_pyradigm',
+                        counting_get_metadata)
+    sys.argv = shlex.split(cli_str)
+    parsed_options = run_workflow.parse_args()
+
+    return parsed_options, len(num_reads)
+
+
+def _cache_test_setup(test_name):
+    "Fresh output folder and a private copy of the input dataset."
+
+    out_dir_cache = pjoin(out_dir, test_name)
+    shutil.rmtree(out_dir_cache, ignore_errors=True)
+    os.makedirs(out_dir_cache)
+    ds_path = pjoin(out_dir_cache, 'input_dataset.pkl')
+    shutil.copy(out_path, ds_path)
+
+    cli_str = 'neuropredict -y {} -t {} -n {} -c 1 -g none -o {}' \
+              ''.format(ds_path, train_perc, num_repetitions, out_dir_cache)
+
+    return out_dir_cache, ds_path, cli_str
+
+
+def test_options_cache_hit(monkeypatch):
+    "Repeat of an identical invocation must not parse the metadata again."
+
+    out_dir_cache, ds_path, cli_str = _cache_test_setup('options_cache_hit')
+
+    first, num_reads = _parse_args_counting_metadata(monkeypatch, cli_str)
+    assert num_reads == 1
+    assert len(os.listdir(pjoin(out_dir_cache, cfg.options_cache_dir))) == 1
+
+    second, num_reads = _parse_args_counting_metadata(monkeypatch, cli_str)
+    assert num_reads == 0
+    assert first[0] == second[0] and first[1] == second[1]
+
+
+def test_options_cache_invalidated_by_input_change(monkeypatch):
+    "Changes to the input files must force the options to be parsed again."
+
+    out_dir_cache, ds_path, cli_str = _cache_test_setup('options_cache_touched')
+
+    _, num_reads = _parse_args_counting_metadata(monkeypatch, cli_str)
+    assert num_reads == 1
+
+    stat = os.stat(ds_path)
+    os.utime(ds_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _, num_reads = _parse_args_counting_metadata(monkeypatch, cli_str)
+    assert num_reads == 1
+
+    # only the latest entry is retained
+    assert len(os.listdir(pjoin(out_dir_cache, cfg.options_cache_dir))) == 1
+
+
+def test_options_no_cache(monkeypatch):
+    "--no_cache must neither read from nor write to the options cache."
+
+    out_dir_cache, ds_path, cli_str = _cache_test_setup('options_no_cache')
+    cache_dir = pjoin(out_dir_cache, cfg.options_cache_dir)
+
+    for _ in range(2):
+        _, num_reads = _parse_args_counting_metadata(monkeypatch,
+                                                     cli_str + ' --no_cache')
+        assert num_reads == 1
+    assert not pexists(cache_dir)
+
+    # an existing entry must be ignored and left untouched
+    _parse_args_counting_metadata(monkeypatch, cli_str)
+    cached_entries = os.listdir(cache_dir)
+    _, num_reads = _parse_args_counting_metadata(monkeypatch,
+                                                 cli_str + ' --no_cache')
+    assert num_reads == 1
+    assert os.listdir(cache_dir) == cached_entries
+
+
+def test_options_cache_hit_restores_options_file(monkeypatch):
+    "Options file must reflect the current run, even on a cache hit."
+
+    out_dir_cache, ds_path, cli_str = _cache_test_setup('options_cache_stale')
+    other_cli_str = cli_str.replace('-t {}'.format(train_perc), '-t 0.6')
+
+    _parse_args_counting_metadata(monkeypatch, cli_str)
+    # another run in the same folder, overwriting the options file
+    _parse_args_counting_metadata(monkeypatch, other_cli_str + ' --no_cache')
+    assert np.isclose(load_options(out_dir_cache)['train_perc'], 0.6)
+
+    parsed_options, num_reads = _parse_args_counting_metadata(monkeypatch,
+                                                              cli_str)
+    assert num_reads == 0
+    saved_options = load_options(out_dir_cache, parsed_options[3])
+    assert np.isclose(saved_options['train_perc'], train_perc)
+
+
+def test_options_cache_revalidates_environment(monkeypatch):
+    "Environment-dependent validation must run again even on a cache hit."
+
+    out_dir_cache, ds_path, cli_str = _cache_test_setup('options_cache_env')
+    _parse_args_counting_metadata(monkeypatch, cli_str)
+
+    num_checks = list()
+    orig_check_num_procs = run_workflow.check_num_procs
+
+    def counting_check_num_procs(*args, **kwargs):
+        num_checks.append(1)
+        return orig_check_num_procs(*args, **kwargs)
+
+    monkeypatch.setattr(run_workflow, 'check_num_procs', counting_check_num_procs)
+    _, num_reads = _parse_args_counting_metadata(monkeypatch, cli_str)
+    assert num_reads == 0
+    assert len(num_checks) == 1
+
+
+def test_options_cache_unusable_entry_is_a_miss(monkeypatch):
+    "Cache entries of unexpected layout (e.g. older versions) must be ignored."
+
+    out_dir_cache, ds_path, cli_str = _cache_test_setup('options_cache_layout')
+    _parse_args_counting_metadata(monkeypatch, cli_str)
+
+    cache_dir = pjoin(out_dir_cache, cfg.options_cache_dir)
+    cache_path = pjoin(cache_dir, os.listdir(cache_dir)[0])
+    with open(cache_path, 'wb') as cache_file:
+        pickle.dump(('sample_ids', 'classes'), cache_file)
+
+    _, num_reads = _parse_args_counting_metadata(monkeypatch, cli_str)
+    assert num_reads == 1
+
+
 # res_path = pjoin(out_dir, 'rhst_results.pkl')
 # run_workflow.make_visualizations(res_path, out_dir)
 # test_chance_clf_default()
@@ -3,6 +3,8 @@ import os
 import sys
 import re
 import pickle
+import hashlib
+import warnings
 from neuropredict import config_neuropredict as cfg
 import numpy as np
 import os.path
@@ -315,6 +317,86 @@ def load_options(out_dir, options_path=None):
     return user_options
 
 
+# only the expensive parsing of inputs and metadata is cached,
+# as the remaining validation depends on the environment (CPUs, modules etc)
+cached_input_fields = ('user_feature_paths', 'user_feature_type', 'fs_subject_dir',
+                       'sample_ids', 'classes')
+
+
+def options_cache_key(user_args, input_paths):
+    """
+    Content-addressed key for the parsed inputs of a given invocation, derived
+    from the neuropredict version, the cmd line args and the mtime/size of the
+    input files.
+    """
+
+    from neuropredict import __version__
+
+    path_stats = list()
+    for path in input_paths:
+        try:
+            stat = os.stat(path)
+            path_stats.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            path_stats.append((path, None, None))
+
+    args = sorted((key, repr(val)) for key, val in vars(user_args).items())
+    key = repr((__version__, tuple(args), tuple(path_stats))).encode('utf-8')
+
+    # blake2b is only available in Python 3.6+
+    if hasattr(hashlib, 'blake2b'):
+        return hashlib.blake2b(key, digest_size=16).hexdigest()
+    else:
+        return hashlib.sha256(key).hexdigest()
+
+
+def load_cached_options(out_dir, cache_key):
+    """
+    Helper to load the inputs and metadata cached from a previous invocation.
+
+    Returns None if there is no usable cache entry for the given key.
+    """
+
+    cache_path = pjoin(out_dir, cfg.options_cache_dir,
+                       '{}.pkl'.format(cache_key))
+    if not pexists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cached_options = pickle.load(cache_file)
+    except:
+        # a stale or corrupt cache must never block a run
+        return None
+
+    if not isinstance(cached_options, dict) or \
+            set(cached_options) != set(cached_input_fields):
+        return None
+
+    return cached_options
+
+
+def cache_options(parsed_inputs, out_dir, cache_key):
+    """
+    Helper to cache the parsed inputs and metadata for later invocations.
+
+    Only the latest entry is kept per output folder, replacing any previous one.
+    """
+
+    cache_dir = pjoin(out_dir, cfg.options_cache_dir)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for stale in os.listdir(cache_dir):
+            if stale.endswith('.pkl'):
+                os.remove(pjoin(cache_dir, stale))
+        with open(pjoin(cache_dir, '{}.pkl'.format(cache_key)), 'wb') as cache_file:
+            pickle.dump(parsed_inputs, cache_file)
+    except:
+        warnings.warn('Unable to cache the options to\n {}'.format(cache_dir))
+
+    return
+
+
 def check_paths(paths, path_type=''):
     "Converts path to absolute paths and ensures they all exist!"
 